@@ -14,14 +14,20 @@ This tool performs ONLY read operations and will never modify or delete resource
 
 import argparse
 import csv
+import json
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator
 import os
 
 try:
     import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError, NoRegionError
+    from botocore.config import Config
+    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, NoRegionError
 except ImportError:
     print("ERROR: boto3 is not installed. Please run: pip install -r requirements.txt")
     sys.exit(1)
@@ -40,23 +46,251 @@ except ImportError:
     sys.exit(1)
 
 
+# Full-width rule used by the console header, summary and footer
+SEPARATOR = f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}"
+
+# Rough monthly cost estimates (USD) used to price zombie resources
+# EBS storage per GB-month by volume type; unknown types use the gp2 price
+EBS_COST_PER_GB = {'gp3': 0.08, 'gp2': 0.10, 'io1': 0.125, 'io2': 0.125, 'st1': 0.045, 'sc1': 0.015}
+EBS_DEFAULT_COST_PER_GB = 0.10
+SNAPSHOT_COST_PER_GB = 0.05          # EBS snapshot storage per GB-month
+EIP_MONTHLY_COST = 3.60              # ~$0.005/hour for an unassociated EIP
+LOAD_BALANCER_MONTHLY_COST = 16.20   # ALB/NLB: ~$0.0225/hour
+RDS_STORAGE_COST_PER_GB = 0.115      # gp2 storage; gp3 is ~$0.096/GB-month
+# ElastiCache on-demand price per node-hour; other node types use NODE_DEFAULT_HOURLY_COST
+NODE_HOURLY_COST = {
+    'cache.t2.micro': 0.017,
+    'cache.t3.micro': 0.017,
+    'cache.t2.small': 0.034,
+    'cache.t3.small': 0.034,
+    'cache.m5.large': 0.136,
+    'cache.r5.large': 0.188,
+}
+NODE_DEFAULT_HOURLY_COST = 0.10      # Conservative estimate
+# Idle Lambda cost by memory tier: (max memory MB, USD/month); larger functions use the last price
+LAMBDA_MEMORY_TIER_COSTS = ((512, 0.50), (1024, 1.00))
+LAMBDA_LARGE_FUNCTION_COST = 2.00
+DYNAMODB_RCU_HOURLY_COST = 0.00013
+DYNAMODB_WCU_HOURLY_COST = 0.00065
+DYNAMODB_STORAGE_COST_PER_GB = 0.25
+DYNAMODB_MIN_MONTHLY_COST = 0.25
+HOURS_PER_MONTH = 730
+
+# Shared client configuration: a connection pool large enough for concurrent
+# scans, adaptive retries to back off on throttling, TCP keepalive, and
+# timeouts short enough that a stalled connection is retried, not waited on
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+    user_agent_extra='cdops-zombie-hunter/1.0',
+)
+
+# EC2 accepts at most 200 values per filter in a single request
+EC2_FILTER_VALUES_LIMIT = 200
+
+# CloudWatch GetMetricData accepts at most 500 queries per request
+CLOUDWATCH_MAX_QUERIES = 500
+
+# Per-item lookups inside a scan (S3 bucket probes, target health checks,
+# DynamoDB describes) run in a small pool of their own. These pools run
+# inside run_scan's workers, so sizing them by --max-workers would allow
+# max_workers squared threads sharing the same client connection pools.
+ITEM_LOOKUP_MAX_WORKERS = 8
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split a list into consecutive chunks of at most `size` items.
+    
+    Args:
+        items: List to split
+        size: Maximum chunk size
+        
+    Returns:
+        Iterator over the chunks
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _lambda_monthly_cost(memory_size: int) -> float:
+    """
+    Estimate the monthly cost of keeping an idle Lambda function.
+    
+    Args:
+        memory_size: Allocated memory in MB
+        
+    Returns:
+        Estimated monthly cost in USD
+    """
+    for max_memory, cost in LAMBDA_MEMORY_TIER_COSTS:
+        if memory_size <= max_memory:
+            return cost
+    return LAMBDA_LARGE_FUNCTION_COST
+
+
+def _dynamodb_monthly_cost(billing_mode: str, table_size_bytes: int) -> float:
+    """
+    Estimate the monthly cost of an idle DynamoDB table.
+    
+    Args:
+        billing_mode: 'PROVISIONED' or 'PAY_PER_REQUEST'
+        table_size_bytes: Table size in bytes
+        
+    Returns:
+        Estimated monthly cost in USD, at least DYNAMODB_MIN_MONTHLY_COST
+    """
+    if billing_mode == 'PROVISIONED':
+        # Provisioned capacity: assume minimal 1 RCU + 1 WCU
+        cost = (DYNAMODB_RCU_HOURLY_COST + DYNAMODB_WCU_HOURLY_COST) * HOURS_PER_MONTH
+    else:
+        # On-demand: storage cost only
+        cost = (table_size_bytes / (1024**3)) * DYNAMODB_STORAGE_COST_PER_GB
+    return max(DYNAMODB_MIN_MONTHLY_COST, cost)
+
+
+def _elasticache_monthly_cost(node_type: str, num_nodes: int) -> float:
+    """
+    Estimate the monthly cost of an idle ElastiCache cluster.
+    
+    Args:
+        node_type: Cache node type (e.g. 'cache.t3.micro')
+        num_nodes: Number of nodes in the cluster
+        
+    Returns:
+        Estimated monthly cost in USD
+    """
+    return NODE_HOURLY_COST.get(node_type, NODE_DEFAULT_HOURLY_COST) * HOURS_PER_MONTH * num_nodes
+
+
+def _batch_get_metric_data(cloudwatch, queries: List[Dict[str, Any]],
+                           start_time: datetime, end_time: datetime) -> Dict[str, List[float]]:
+    """
+    Run CloudWatch metric queries in as few GetMetricData requests as possible.
+    
+    Each query is billed as one metric, so give every query a single 'Stat'.
+    Needing another statistic for the same metric means adding another query.
+    
+    Args:
+        cloudwatch: boto3 CloudWatch client
+        queries: MetricDataQueries entries, each with a unique 'Id'
+        start_time: Start of the metric window
+        end_time: End of the metric window
+        
+    Returns:
+        Dictionary mapping query Id to its datapoint values. Queries CloudWatch
+        could not answer (e.g. 'Forbidden' or 'InternalError') are omitted.
+    """
+    values = {}
+    failed = set()
+    paginator = cloudwatch.get_paginator('get_metric_data')
+    
+    for batch in _chunks(queries, CLOUDWATCH_MAX_QUERIES):
+        for page in paginator.paginate(MetricDataQueries=batch, StartTime=start_time, EndTime=end_time):
+            for result in page.get('MetricDataResults', []):
+                if result.get('StatusCode') in ('Complete', 'PartialData'):
+                    values.setdefault(result['Id'], []).extend(result.get('Values', []))
+                else:
+                    failed.add(result['Id'])
+    
+    for query_id in failed:
+        values.pop(query_id, None)
+    
+    return values
+
+
+@dataclass
+class Zombie:
+    """
+    A single zombie resource finding.
+    
+    The fields every finding has are stored in slots; resource-specific
+    details (sizes, timestamps, names, ...) go in `extra`.
+    """
+    __slots__ = ('resource_type', 'resource_id', 'region', 'estimated_monthly_cost', 'reason', 'extra')
+    
+    resource_type: str
+    resource_id: str
+    region: str
+    estimated_monthly_cost: float
+    reason: str
+    extra: Dict[str, Any]
+    
+    def as_row(self) -> Dict[str, Any]:
+        """
+        Flatten the finding into a report row with display-formatted values.
+        
+        Returns:
+            Dictionary mapping column names to values
+        """
+        # Timestamps are written as 'YYYY-MM-DD HH:MM:SS'; isoformat() is faster
+        # than strftime(), and the slice drops the UTC offset of aware values
+        row = {
+            key: value.isoformat(sep=' ', timespec='seconds')[:19] if isinstance(value, datetime) else value
+            for key, value in self.extra.items()
+        }
+        row.update({
+            'resource_type': self.resource_type,
+            'resource_id': self.resource_id,
+            'region': self.region,
+            'estimated_monthly_cost': f"${self.estimated_monthly_cost:.2f}",
+            'reason': self.reason
+        })
+        return row
+    
+    def as_record(self) -> Dict[str, Any]:
+        """
+        Flatten the finding into a JSON-serializable record with raw values.
+        
+        Returns:
+            Dictionary mapping field names to values
+        """
+        record = {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in self.extra.items()
+        }
+        record.update({
+            'resource_type': self.resource_type,
+            'resource_id': self.resource_id,
+            'region': self.region,
+            'estimated_monthly_cost': round(self.estimated_monthly_cost, 2),
+            'reason': self.reason
+        })
+        return record
+
+
 class ZombieHunter:
     """
     Main class for scanning AWS resources and identifying unused/wasted resources.
     All operations are read-only and safe.
     """
     
-    def __init__(self, regions: List[str], verbose: bool = False):
+    def __init__(self, regions: List[str], verbose: bool = False, max_workers: int = 16):
         """
         Initialize the Zombie Hunter.
         
         Args:
             regions: List of AWS regions to scan
             verbose: Enable verbose logging
+            max_workers: Maximum number of scans to run concurrently
         """
         self.regions = regions
         self.verbose = verbose
+        self.max_workers = max_workers
+        # boto3 sessions are not thread-safe, so clients are created under a lock
+        # and cached per (service, region) to reuse their connection pools
+        self._session = boto3.session.Session()
+        self._clients = {}
+        self._client_lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        # Every worker may share one client, so never give it fewer connections than workers
+        self._config = BOTO_CONFIG.merge(Config(max_pool_connections=max(BOTO_CONFIG.max_pool_connections, max_workers)))
         self.findings = []
+        # Running total of estimated_monthly_cost, updated as findings are collected
+        self._total_savings = 0.0
         self.scan_summary = {
             'unattached_ebs_volumes': 0,
             'obsolete_snapshots': 0,
@@ -74,15 +308,41 @@ class ZombieHunter:
     def log(self, message: str, level: str = "INFO"):
         """Print log messages with proper formatting."""
         if level == "ERROR":
-            print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+            line = f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}"
         elif level == "WARNING":
-            print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
+            line = f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}"
         elif level == "SUCCESS":
-            print(f"{Fore.GREEN}[SUCCESS] {message}{Style.RESET_ALL}")
+            line = f"{Fore.GREEN}[SUCCESS] {message}{Style.RESET_ALL}"
         elif self.verbose or level == "INFO":
-            print(f"[INFO] {message}")
+            line = f"[INFO] {message}"
+        else:
+            return
+        
+        # print() writes the text and the newline separately, so lines from
+        # concurrent scans could interleave without the lock
+        with self._log_lock:
+            print(line)
+    
+    def _client(self, service: str, region: str = None):
+        """
+        Get a cached boto3 client, creating it from the shared session on first use.
+        
+        Args:
+            service: AWS service name (e.g. 'ec2')
+            region: AWS region, or None for global services
+            
+        Returns:
+            boto3 client for the service
+        """
+        key = (service, region)
+        with self._client_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._session.client(service, region_name=region, config=self._config)
+                self._clients[key] = client
+        return client
     
-    def scan_unattached_ebs_volumes(self, region: str) -> List[Dict[str, Any]]:
+    def scan_unattached_ebs_volumes(self, region: str) -> List[Zombie]:
         """
         Scan for EBS volumes that are in 'available' state (not attached to any instance).
         These volumes still incur storage costs but aren't being used.
@@ -91,45 +351,45 @@ class ZombieHunter:
             region: AWS region to scan
             
         Returns:
-            List of dictionaries containing zombie volume details
+            List of Zombie records for zombie volumes
         """
         zombies = []
         
         try:
-            ec2 = boto3.client('ec2', region_name=region)
+            ec2 = self._client('ec2', region)
             self.log(f"Scanning for unattached EBS volumes in {region}...", "INFO")
             
-            # Describe all volumes with state 'available' (unattached)
-            response = ec2.describe_volumes(
-                Filters=[{'Name': 'status', 'Values': ['available']}]
+            # Describe all volumes with state 'available' (unattached), 500 per
+            # page (the DescribeVolumes maximum) so responses stay bounded
+            paginator = ec2.get_paginator('describe_volumes')
+            pages = paginator.paginate(
+                Filters=[{'Name': 'status', 'Values': ['available']}],
+                PaginationConfig={'PageSize': 500}
             )
-            
-            for volume in response.get('Volumes', []):
-                volume_id = volume['VolumeId']
-                size_gb = volume['Size']
-                volume_type = volume['VolumeType']
-                create_time = volume['CreateTime']
-                
-                # Calculate cost estimate (rough estimate in USD/month)
-                # gp3: $0.08/GB/month, gp2: $0.10/GB/month, io1/io2: $0.125/GB/month
-                cost_per_gb = {'gp3': 0.08, 'gp2': 0.10, 'io1': 0.125, 'io2': 0.125, 'st1': 0.045, 'sc1': 0.015}
-                estimated_monthly_cost = size_gb * cost_per_gb.get(volume_type, 0.10)
-                
-                zombie = {
-                    'resource_type': 'EBS Volume',
-                    'resource_id': volume_id,
-                    'region': region,
-                    'size_gb': size_gb,
-                    'volume_type': volume_type,
-                    'created': create_time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                    'reason': 'Unattached (available state)'
-                }
-                
-                zombies.append(zombie)
-                self.findings.append(zombie)
-            
-            self.scan_summary['unattached_ebs_volumes'] += len(zombies)
+            for page in pages:
+                for volume in page.get('Volumes', []):
+                    volume_id = volume['VolumeId']
+                    size_gb = volume['Size']
+                    volume_type = volume['VolumeType']
+                    create_time = volume['CreateTime']
+                    
+                    # Calculate cost estimate (rough estimate in USD/month)
+                    estimated_monthly_cost = size_gb * EBS_COST_PER_GB.get(volume_type, EBS_DEFAULT_COST_PER_GB)
+                    
+                    zombie = Zombie(
+                        resource_type='EBS Volume',
+                        resource_id=volume_id,
+                        region=region,
+                        estimated_monthly_cost=estimated_monthly_cost,
+                        reason='Unattached (available state)',
+                        extra={
+                            'size_gb': size_gb,
+                            'volume_type': volume_type,
+                            'created': create_time
+                        }
+                    )
+                    
+                    zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} unattached EBS volumes in {region}", "WARNING")
@@ -142,12 +402,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for EBS volumes in {region}. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning EBS volumes in {region}: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning EBS volumes in {region}: {e}", "ERROR")
         
         return zombies
     
-    def scan_obsolete_snapshots(self, region: str) -> List[Dict[str, Any]]:
+    def scan_obsolete_snapshots(self, region: str) -> List[Zombie]:
         """
         Scan for EBS snapshots older than 30 days that are NOT associated with active AMIs.
         These snapshots may be safe to delete and are incurring storage costs.
@@ -156,57 +416,72 @@ class ZombieHunter:
             region: AWS region to scan
             
         Returns:
-            List of dictionaries containing zombie snapshot details
+            List of Zombie records for zombie snapshots
         """
         zombies = []
         
         try:
-            ec2 = boto3.client('ec2', region_name=region)
+            ec2 = self._client('ec2', region)
             self.log(f"Scanning for obsolete snapshots in {region}...", "INFO")
             
-            # Get all snapshots owned by this account
-            response = ec2.describe_snapshots(OwnerIds=['self'])
-            
             # Get all AMIs to identify which snapshots are in use
-            amis_response = ec2.describe_images(Owners=['self'])
+            ami_pages = ec2.get_paginator('describe_images').paginate(Owners=['self'])
             
             # Extract snapshot IDs that are used by AMIs
-            snapshots_in_use = set()
-            for ami in amis_response.get('Images', []):
-                for block_device in ami.get('BlockDeviceMappings', []):
-                    if 'Ebs' in block_device and 'SnapshotId' in block_device['Ebs']:
-                        snapshots_in_use.add(block_device['Ebs']['SnapshotId'])
+            snapshots_in_use = {
+                block_device['Ebs']['SnapshotId']
+                for page in ami_pages
+                for ami in page.get('Images', [])
+                for block_device in ami.get('BlockDeviceMappings', [])
+                if 'SnapshotId' in block_device.get('Ebs', {})
+            }
             
             # Check each snapshot
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=30)
+            now = datetime.now(timezone.utc)
+            cutoff_date = now - timedelta(days=30)
+            
+            # Stream completed snapshots owned by this account; EC2 has no
+            # server-side age filter, so age is checked per snapshot below.
+            # Without a page size EC2 returns every snapshot in one response,
+            # which can outlast the read timeout on large accounts.
+            paginator = ec2.get_paginator('describe_snapshots')
+            pages = paginator.paginate(
+                OwnerIds=['self'],
+                Filters=[{'Name': 'status', 'Values': ['completed']}],
+                PaginationConfig={'PageSize': 1000}
+            )
             
-            for snapshot in response.get('Snapshots', []):
-                snapshot_id = snapshot['SnapshotId']
+            # Only flag snapshots that are:
+            # 1. Older than 30 days
+            # 2. NOT used by any AMI
+            stale_snapshots = (
+                snapshot
+                for page in pages
+                for snapshot in page.get('Snapshots', [])
+                if snapshot['StartTime'] < cutoff_date and snapshot['SnapshotId'] not in snapshots_in_use
+            )
+            
+            for snapshot in stale_snapshots:
                 start_time = snapshot['StartTime']
                 volume_size = snapshot['VolumeSize']
                 
-                # Only flag snapshots that are:
-                # 1. Older than 30 days
-                # 2. NOT used by any AMI
-                if start_time < cutoff_date and snapshot_id not in snapshots_in_use:
-                    # Snapshot storage cost: ~$0.05/GB/month
-                    estimated_monthly_cost = volume_size * 0.05
-                    
-                    zombie = {
-                        'resource_type': 'EBS Snapshot',
-                        'resource_id': snapshot_id,
-                        'region': region,
+                # Snapshot storage cost: ~$0.05/GB/month
+                estimated_monthly_cost = volume_size * SNAPSHOT_COST_PER_GB
+                
+                zombie = Zombie(
+                    resource_type='EBS Snapshot',
+                    resource_id=snapshot['SnapshotId'],
+                    region=region,
+                    estimated_monthly_cost=estimated_monthly_cost,
+                    reason='Older than 30 days and not linked to any AMI',
+                    extra={
                         'size_gb': volume_size,
-                        'created': start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                        'age_days': (datetime.now(timezone.utc) - start_time).days,
-                        'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                        'reason': 'Older than 30 days and not linked to any AMI'
+                        'created': start_time,
+                        'age_days': (now - start_time).days
                     }
-                    
-                    zombies.append(zombie)
-                    self.findings.append(zombie)
-            
-            self.scan_summary['obsolete_snapshots'] += len(zombies)
+                )
+                
+                zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} obsolete snapshots in {region}", "WARNING")
@@ -219,12 +494,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for snapshots in {region}. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning snapshots in {region}: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning snapshots in {region}: {e}", "ERROR")
         
         return zombies
     
-    def scan_idle_ec2_instances(self, region: str) -> List[Dict[str, Any]]:
+    def scan_idle_ec2_instances(self, region: str) -> List[Zombie]:
         """
         Scan for EC2 instances in 'stopped' state for more than 7 days.
         Stopped instances still incur costs for attached EBS volumes.
@@ -233,71 +508,87 @@ class ZombieHunter:
             region: AWS region to scan
             
         Returns:
-            List of dictionaries containing idle instance details
+            List of Zombie records for idle instances
         """
         zombies = []
         
         try:
-            ec2 = boto3.client('ec2', region_name=region)
+            ec2 = self._client('ec2', region)
             self.log(f"Scanning for idle EC2 instances in {region}...", "INFO")
             
             # Get all stopped instances
-            response = ec2.describe_instances(
+            instance_pages = ec2.get_paginator('describe_instances').paginate(
                 Filters=[{'Name': 'instance-state-name', 'Values': ['stopped']}]
             )
             
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
             
-            for reservation in response.get('Reservations', []):
-                for instance in reservation.get('Instances', []):
-                    instance_id = instance['InstanceId']
-                    instance_type = instance['InstanceType']
-                    
-                    # Get instance name from tags
-                    instance_name = 'N/A'
-                    for tag in instance.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            instance_name = tag['Value']
-                            break
-                    
-                    # Try to determine when instance was stopped
-                    # Note: StateTransitionReason is a string, not always parseable
-                    state_transition = instance.get('StateTransitionReason', '')
-                    
-                    # We'll flag all stopped instances as potential zombies
-                    # In production, you might want CloudWatch metrics to determine actual idle time
-                    
-                    # Calculate EBS volume costs for attached volumes
-                    total_ebs_size = 0
-                    for block_device in instance.get('BlockDeviceMappings', []):
-                        if 'Ebs' in block_device:
-                            volume_id = block_device['Ebs']['VolumeId']
-                            try:
-                                vol_response = ec2.describe_volumes(VolumeIds=[volume_id])
-                                if vol_response['Volumes']:
-                                    total_ebs_size += vol_response['Volumes'][0]['Size']
-                            except:
-                                pass
-                    
-                    # Rough estimate: EBS storage costs while instance is stopped
-                    estimated_monthly_cost = total_ebs_size * 0.10
-                    
-                    zombie = {
-                        'resource_type': 'EC2 Instance',
-                        'resource_id': instance_id,
-                        'region': region,
+            instances = [
+                instance
+                for page in instance_pages
+                for reservation in page.get('Reservations', [])
+                for instance in reservation.get('Instances', [])
+            ]
+            
+            # Sum attached EBS storage per instance, filtering volumes by the
+            # attached instance ID. Instances without EBS mappings are skipped.
+            stopped_ids = [
+                instance['InstanceId']
+                for instance in instances
+                if any('Ebs' in block_device for block_device in instance.get('BlockDeviceMappings', []))
+            ]
+            size_by_instance = defaultdict(int)
+            paginator = ec2.get_paginator('describe_volumes')
+            for batch in _chunks(stopped_ids, EC2_FILTER_VALUES_LIMIT):
+                batch_ids = set(batch)
+                pages = paginator.paginate(
+                    Filters=[{'Name': 'attachment.instance-id', 'Values': batch}],
+                    PaginationConfig={'PageSize': 500}
+                )
+                for page in pages:
+                    for volume in page.get('Volumes', []):
+                        for attachment in volume.get('Attachments', []):
+                            if attachment.get('InstanceId') in batch_ids:
+                                size_by_instance[attachment['InstanceId']] += volume['Size']
+            
+            for instance in instances:
+                instance_id = instance['InstanceId']
+                instance_type = instance['InstanceType']
+                
+                # Get instance name from tags
+                instance_name = next(
+                    (tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'),
+                    'N/A'
+                )
+                
+                # Try to determine when instance was stopped
+                # Note: StateTransitionReason is a string, not always parseable
+                state_transition = instance.get('StateTransitionReason', '')
+                
+                # We'll flag all stopped instances as potential zombies
+                # In production, you might want CloudWatch metrics to determine actual idle time
+                
+                # Calculate EBS volume costs for attached volumes
+                total_ebs_size = size_by_instance[instance_id]
+                
+                # Rough estimate: EBS storage costs while instance is stopped
+                estimated_monthly_cost = total_ebs_size * EBS_DEFAULT_COST_PER_GB
+                
+                zombie = Zombie(
+                    resource_type='EC2 Instance',
+                    resource_id=instance_id,
+                    region=region,
+                    estimated_monthly_cost=estimated_monthly_cost,
+                    reason='Instance stopped (EBS volumes still incurring costs)',
+                    extra={
                         'instance_type': instance_type,
                         'name': instance_name,
                         'state': 'stopped',
-                        'ebs_size_gb': total_ebs_size,
-                        'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                        'reason': 'Instance stopped (EBS volumes still incurring costs)'
+                        'ebs_size_gb': total_ebs_size
                     }
-                    
-                    zombies.append(zombie)
-                    self.findings.append(zombie)
-            
-            self.scan_summary['idle_ec2_instances'] += len(zombies)
+                )
+                
+                zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} idle EC2 instances in {region}", "WARNING")
@@ -310,12 +601,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for EC2 instances in {region}. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning EC2 instances in {region}: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning EC2 instances in {region}: {e}", "ERROR")
         
         return zombies
     
-    def scan_unassociated_eips(self, region: str) -> List[Dict[str, Any]]:
+    def scan_unassociated_eips(self, region: str) -> List[Zombie]:
         """
         Scan for Elastic IPs that are allocated but not associated with any instance.
         Unattached EIPs incur hourly charges.
@@ -324,12 +615,12 @@ class ZombieHunter:
             region: AWS region to scan
             
         Returns:
-            List of dictionaries containing unassociated EIP details
+            List of Zombie records for unassociated EIPs
         """
         zombies = []
         
         try:
-            ec2 = boto3.client('ec2', region_name=region)
+            ec2 = self._client('ec2', region)
             self.log(f"Scanning for unassociated Elastic IPs in {region}...", "INFO")
             
             # Get all Elastic IPs
@@ -342,21 +633,20 @@ class ZombieHunter:
                     public_ip = address.get('PublicIp', 'N/A')
                     
                     # Unassociated EIP cost: ~$0.005/hour = ~$3.60/month
-                    estimated_monthly_cost = 3.60
+                    estimated_monthly_cost = EIP_MONTHLY_COST
                     
-                    zombie = {
-                        'resource_type': 'Elastic IP',
-                        'resource_id': allocation_id,
-                        'region': region,
-                        'public_ip': public_ip,
-                        'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                        'reason': 'Allocated but not associated with any instance'
-                    }
+                    zombie = Zombie(
+                        resource_type='Elastic IP',
+                        resource_id=allocation_id,
+                        region=region,
+                        estimated_monthly_cost=estimated_monthly_cost,
+                        reason='Allocated but not associated with any instance',
+                        extra={
+                            'public_ip': public_ip
+                        }
+                    )
                     
                     zombies.append(zombie)
-                    self.findings.append(zombie)
-            
-            self.scan_summary['unassociated_eips'] += len(zombies)
             
             if zombies:
                 self.log(f"Found {len(zombies)} unassociated Elastic IPs in {region}", "WARNING")
@@ -369,12 +659,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for Elastic IPs in {region}. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning Elastic IPs in {region}: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning Elastic IPs in {region}: {e}", "ERROR")
         
         return zombies
     
-    def scan_unused_load_balancers(self, region: str) -> List[Dict[str, Any]]:
+    def scan_unused_load_balancers(self, region: str) -> List[Zombie]:
         """
         Scan for Application/Network Load Balancers (ELBv2) with zero registered targets.
         Load balancers incur hourly costs even with no traffic.
@@ -383,66 +673,80 @@ class ZombieHunter:
             region: AWS region to scan
             
         Returns:
-            List of dictionaries containing unused load balancer details
+            List of Zombie records for unused load balancers
         """
         zombies = []
         
         try:
-            elbv2 = boto3.client('elbv2', region_name=region)
+            elbv2 = self._client('elbv2', region)
             self.log(f"Scanning for unused load balancers in {region}...", "INFO")
             
             # Get all load balancers
-            response = elbv2.describe_load_balancers()
+            paginator = elbv2.get_paginator('describe_load_balancers')
+            load_balancers = [lb for page in paginator.paginate() for lb in page.get('LoadBalancers', [])]
+            
+            # List every target group in the region once and index them by the
+            # load balancers they are attached to. Detached target groups are skipped.
+            lbs_by_target_group = {}
+            tg_paginator = elbv2.get_paginator('describe_target_groups')
+            for page in tg_paginator.paginate():
+                for tg in page.get('TargetGroups', []):
+                    if tg.get('LoadBalancerArns'):
+                        lbs_by_target_group[tg['TargetGroupArn']] = tg['LoadBalancerArns']
+            
+            def has_healthy_targets(tg_arn):
+                try:
+                    health_response = elbv2.describe_target_health(TargetGroupArn=tg_arn)
+                except ClientError:
+                    return False
+                return any(
+                    target.get('TargetHealth', {}).get('State') == 'healthy'
+                    for target in health_response.get('TargetHealthDescriptions', [])
+                )
+            
+            # Check target health concurrently. As soon as a load balancer has a
+            # healthy target, pending checks that only concern load balancers
+            # already known to be in use are cancelled.
+            in_use = set()
+            
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, ITEM_LOOKUP_MAX_WORKERS)) as executor:
+                health_checks = {
+                    executor.submit(has_healthy_targets, tg_arn): tg_arn
+                    for tg_arn in lbs_by_target_group
+                }
+                
+                for future in as_completed(health_checks):
+                    if future.cancelled() or not future.result():
+                        continue
+                    in_use.update(lbs_by_target_group[health_checks[future]])
+                    for pending, tg_arn in health_checks.items():
+                        if in_use.issuperset(lbs_by_target_group[tg_arn]):
+                            pending.cancel()
             
-            for lb in response.get('LoadBalancers', []):
+            for lb in load_balancers:
                 lb_arn = lb['LoadBalancerArn']
                 lb_name = lb['LoadBalancerName']
                 lb_type = lb['Type']  # 'application' or 'network'
                 created_time = lb['CreatedTime']
                 
-                # Get target groups for this load balancer
-                try:
-                    tg_response = elbv2.describe_target_groups(LoadBalancerArn=lb_arn)
-                    
-                    total_healthy_targets = 0
-                    
-                    # Check each target group for healthy targets
-                    for tg in tg_response.get('TargetGroups', []):
-                        tg_arn = tg['TargetGroupArn']
-                        
-                        try:
-                            health_response = elbv2.describe_target_health(TargetGroupArn=tg_arn)
-                            
-                            # Count healthy targets
-                            for target in health_response.get('TargetHealthDescriptions', []):
-                                if target.get('TargetHealth', {}).get('State') == 'healthy':
-                                    total_healthy_targets += 1
-                        except:
-                            pass
+                # If no healthy targets, it's a zombie
+                if lb_arn not in in_use:
+                    # ALB: ~$0.0225/hour = ~$16.20/month, NLB: ~$0.0225/hour = ~$16.20/month
+                    estimated_monthly_cost = LOAD_BALANCER_MONTHLY_COST
                     
-                    # If no healthy targets, it's a zombie
-                    if total_healthy_targets == 0:
-                        # ALB: ~$0.0225/hour = ~$16.20/month, NLB: ~$0.0225/hour = ~$16.20/month
-                        estimated_monthly_cost = 16.20
-                        
-                        zombie = {
-                            'resource_type': f'Load Balancer ({lb_type.upper()})',
-                            'resource_id': lb_name,
-                            'region': region,
+                    zombie = Zombie(
+                        resource_type=f'Load Balancer ({lb_type.upper()})',
+                        resource_id=lb_name,
+                        region=region,
+                        estimated_monthly_cost=estimated_monthly_cost,
+                        reason='No healthy targets registered',
+                        extra={
                             'arn': lb_arn,
-                            'created': created_time.strftime('%Y-%m-%d %H:%M:%S'),
-                            'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                            'reason': 'No healthy targets registered'
+                            'created': created_time
                         }
-                        
-                        zombies.append(zombie)
-                        self.findings.append(zombie)
-                        
-                except ClientError:
-                    # Load balancer might not have target groups
-                    pass
-            
-            self.scan_summary['unused_load_balancers'] += len(zombies)
+                    )
+                    
+                    zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} unused load balancers in {region}", "WARNING")
@@ -455,12 +759,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for load balancers in {region}. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning load balancers in {region}: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning load balancers in {region}: {e}", "ERROR")
         
         return zombies
     
-    def scan_idle_rds_instances(self, region: str) -> List[Dict[str, Any]]:
+    def scan_idle_rds_instances(self, region: str) -> List[Zombie]:
         """
         Scan for RDS database instances that are in 'stopped' state or have very low connections.
         Stopped RDS instances still incur storage costs.
@@ -469,46 +773,45 @@ class ZombieHunter:
             region: AWS region to scan
             
         Returns:
-            List of dictionaries containing idle RDS instance details
+            List of Zombie records for idle RDS instances
         """
         zombies = []
         
         try:
-            rds = boto3.client('rds', region_name=region)
+            rds = self._client('rds', region)
             self.log(f"Scanning for idle RDS instances in {region}...", "INFO")
             
             # Get all RDS instances
-            response = rds.describe_db_instances()
-            
-            for db_instance in response.get('DBInstances', []):
-                db_id = db_instance['DBInstanceIdentifier']
-                db_status = db_instance['DBInstanceStatus']
-                db_class = db_instance['DBInstanceClass']
-                engine = db_instance['Engine']
-                storage_gb = db_instance['AllocatedStorage']
-                
-                # Flag stopped instances
-                if db_status == 'stopped':
-                    # Rough cost estimate for stopped RDS (storage only)
-                    # gp2 storage: ~$0.115/GB/month, gp3: ~$0.096/GB/month
-                    estimated_monthly_cost = storage_gb * 0.115
-                    
-                    zombie = {
-                        'resource_type': 'RDS Instance',
-                        'resource_id': db_id,
-                        'region': region,
-                        'status': db_status,
-                        'instance_class': db_class,
-                        'engine': engine,
-                        'storage_gb': storage_gb,
-                        'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                        'reason': 'Instance stopped (storage costs continue)'
-                    }
+            paginator = rds.get_paginator('describe_db_instances')
+            for page in paginator.paginate():
+                for db_instance in page.get('DBInstances', []):
+                    db_id = db_instance['DBInstanceIdentifier']
+                    db_status = db_instance['DBInstanceStatus']
+                    db_class = db_instance['DBInstanceClass']
+                    engine = db_instance['Engine']
+                    storage_gb = db_instance['AllocatedStorage']
                     
-                    zombies.append(zombie)
-                    self.findings.append(zombie)
-            
-            self.scan_summary['idle_rds_instances'] += len(zombies)
+                    # Flag stopped instances
+                    if db_status == 'stopped':
+                        # Rough cost estimate for stopped RDS (storage only)
+                        # gp2 storage: ~$0.115/GB/month, gp3: ~$0.096/GB/month
+                        estimated_monthly_cost = storage_gb * RDS_STORAGE_COST_PER_GB
+                        
+                        zombie = Zombie(
+                            resource_type='RDS Instance',
+                            resource_id=db_id,
+                            region=region,
+                            estimated_monthly_cost=estimated_monthly_cost,
+                            reason='Instance stopped (storage costs continue)',
+                            extra={
+                                'status': db_status,
+                                'instance_class': db_class,
+                                'engine': engine,
+                                'storage_gb': storage_gb
+                            }
+                        )
+                        
+                        zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} idle RDS instances in {region}", "WARNING")
@@ -521,78 +824,104 @@ class ZombieHunter:
                 self.log(f"Permission denied for RDS instances in {region}. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning RDS instances in {region}: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning RDS instances in {region}: {e}", "ERROR")
         
         return zombies
     
-    def scan_empty_s3_buckets(self, region: str) -> List[Dict[str, Any]]:
+    def scan_empty_s3_buckets(self, region: str) -> List[Zombie]:
         """
         Scan for S3 buckets that are completely empty or have very few objects.
         Empty buckets may indicate abandoned projects or unused infrastructure.
-        Note: S3 is global but we'll scan once (not per region).
+        Note: S3 is global, so run_scan schedules this once (not per region).
         
         Args:
             region: AWS region (S3 is global, but we need it for consistency)
             
         Returns:
-            List of dictionaries containing empty S3 bucket details
+            List of Zombie records for empty S3 buckets
         """
         zombies = []
         
-        # Only scan S3 once (not per region) - skip if not first region
-        if region != self.regions[0]:
-            return zombies
-        
         try:
-            s3 = boto3.client('s3')
+            s3 = self._client('s3')
             self.log(f"Scanning for empty S3 buckets (global scan)...", "INFO")
             
-            # Get all S3 buckets
-            response = s3.list_buckets()
+            # Get all S3 buckets; ListBuckets only pages when a page size is given.
+            # botocore releases before ListBuckets pagination (late 2024) have no
+            # paginator, and there a single call returns every bucket.
+            if s3.can_paginate('list_buckets'):
+                bucket_pages = s3.get_paginator('list_buckets').paginate(
+                    PaginationConfig={'PageSize': 1000}
+                )
+            else:
+                bucket_pages = [s3.list_buckets()]
+            buckets = [bucket for page in bucket_pages for bucket in page.get('Buckets', [])]
             
-            for bucket in response.get('Buckets', []):
+            # Buckets whose versions could not be listed; reported once below
+            denied_buckets = []
+            
+            def probe_bucket(bucket):
                 bucket_name = bucket['Name']
                 created_date = bucket['CreationDate']
                 
                 try:
-                    # Check if bucket is empty
-                    objects_response = s3.list_objects_v2(Bucket=bucket_name, MaxKeys=1)
-                    object_count = objects_response.get('KeyCount', 0)
+                    # Check if bucket is empty. Versioned buckets can hold noncurrent
+                    # versions and delete markers that list_objects_v2 does not show.
+                    versions_response = s3.list_object_versions(Bucket=bucket_name, MaxKeys=1)
+                    if versions_response.get('Versions') or versions_response.get('DeleteMarkers'):
+                        return None
                     
-                    if object_count == 0:
-                        # Get bucket location
-                        try:
-                            location_response = s3.get_bucket_location(Bucket=bucket_name)
-                            bucket_region = location_response.get('LocationConstraint') or 'us-east-1'
-                        except:
-                            bucket_region = 'unknown'
-                        
-                        # Empty bucket - minimal cost but indicates unused resource
-                        # S3 standard storage: $0.023/GB/month, but empty = ~$0
-                        estimated_monthly_cost = 0.00
-                        
-                        zombie = {
-                            'resource_type': 'S3 Bucket',
-                            'resource_id': bucket_name,
-                            'region': bucket_region,
-                            'created': created_date.strftime('%Y-%m-%d %H:%M:%S'),
-                            'object_count': 0,
-                            'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                            'reason': 'Bucket is completely empty (may be abandoned)'
+                    # head_bucket reports the bucket's region in a response header,
+                    # even when it fails with a redirect or access error
+                    try:
+                        head_response = s3.head_bucket(Bucket=bucket_name)
+                    except ClientError as e:
+                        head_response = e.response
+                    headers = head_response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+                    bucket_region = headers.get('x-amz-bucket-region', 'unknown')
+                    
+                    # Empty bucket - minimal cost but indicates unused resource
+                    # S3 standard storage: $0.023/GB/month, but empty = ~$0
+                    estimated_monthly_cost = 0.00
+                    
+                    return Zombie(
+                        resource_type='S3 Bucket',
+                        resource_id=bucket_name,
+                        region=bucket_region,
+                        estimated_monthly_cost=estimated_monthly_cost,
+                        reason='Bucket is completely empty (may be abandoned)',
+                        extra={
+                            'created': created_date,
+                            'object_count': 0
                         }
-                        
-                        zombies.append(zombie)
-                        self.findings.append(zombie)
-                        
+                    )
+                    
                 except ClientError as e:
                     # Bucket might have access restrictions
-                    if e.response['Error']['Code'] != 'AccessDenied':
+                    if e.response['Error']['Code'] == 'AccessDenied':
+                        denied_buckets.append(bucket_name)
+                    else:
                         self.log(f"Could not check bucket {bucket_name}: {e}", "WARNING")
                 except Exception as e:
+                    # BotoCoreError or an unexpected response; skip only this bucket
+                    # rather than failing the scan for every other bucket
                     self.log(f"Error checking bucket {bucket_name}: {e}", "WARNING")
+                return None
             
-            self.scan_summary['empty_s3_buckets'] += len(zombies)
+            # Probe buckets concurrently; map() keeps results in bucket order
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, ITEM_LOOKUP_MAX_WORKERS)) as executor:
+                for zombie in executor.map(probe_bucket, buckets):
+                    if zombie is None:
+                        continue
+                    zombies.append(zombie)
+            
+            if denied_buckets:
+                self.log(
+                    f"Permission denied listing object versions for {len(denied_buckets)} S3 buckets "
+                    f"(requires s3:ListBucketVersions). Skipping them...",
+                    "WARNING"
+                )
             
             if zombies:
                 self.log(f"Found {len(zombies)} empty S3 buckets", "WARNING")
@@ -605,66 +934,57 @@ class ZombieHunter:
                 self.log(f"Permission denied for S3 buckets. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning S3 buckets: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning S3 buckets: {e}", "ERROR")
         
         return zombies
     
-    def scan_unused_cloudfront_distributions(self, region: str) -> List[Dict[str, Any]]:
+    def scan_unused_cloudfront_distributions(self, region: str) -> List[Zombie]:
         """
         Scan for CloudFront distributions that are disabled or have very low traffic.
-        CloudFront is global, so we only scan once.
+        CloudFront is global, so run_scan schedules this once (not per region).
         
         Args:
             region: AWS region (CloudFront is global, but we need it for consistency)
             
         Returns:
-            List of dictionaries containing unused CloudFront distribution details
+            List of Zombie records for unused CloudFront distributions
         """
         zombies = []
         
-        # Only scan CloudFront once (not per region) - skip if not first region
-        if region != self.regions[0]:
-            return zombies
-        
         try:
-            cloudfront = boto3.client('cloudfront')
+            cloudfront = self._client('cloudfront')
             self.log(f"Scanning for unused CloudFront distributions (global scan)...", "INFO")
             
             # Get all CloudFront distributions
-            response = cloudfront.list_distributions()
-            
-            if 'DistributionList' not in response or 'Items' not in response['DistributionList']:
-                self.log(f"No CloudFront distributions found", "SUCCESS")
-                return zombies
-            
-            for distribution in response['DistributionList']['Items']:
-                dist_id = distribution['Id']
-                domain_name = distribution['DomainName']
-                status = distribution['Status']
-                enabled = distribution['Enabled']
-                
-                # Flag disabled distributions
-                if not enabled:
-                    # CloudFront cost: ~$0.085/GB transfer + $0.012 per 10,000 requests
-                    # Disabled distributions still exist in config but cost minimal
-                    estimated_monthly_cost = 0.10  # Minimal management overhead
-                    
-                    zombie = {
-                        'resource_type': 'CloudFront Distribution',
-                        'resource_id': dist_id,
-                        'region': 'global',
-                        'domain_name': domain_name,
-                        'status': status,
-                        'enabled': enabled,
-                        'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                        'reason': 'Distribution is disabled but still exists'
-                    }
+            paginator = cloudfront.get_paginator('list_distributions')
+            for page in paginator.paginate():
+                for distribution in page.get('DistributionList', {}).get('Items', []):
+                    dist_id = distribution['Id']
+                    domain_name = distribution['DomainName']
+                    status = distribution['Status']
+                    enabled = distribution['Enabled']
                     
-                    zombies.append(zombie)
-                    self.findings.append(zombie)
-            
-            self.scan_summary['unused_cloudfront_distributions'] += len(zombies)
+                    # Flag disabled distributions
+                    if not enabled:
+                        # CloudFront cost: ~$0.085/GB transfer + $0.012 per 10,000 requests
+                        # Disabled distributions still exist in config but cost minimal
+                        estimated_monthly_cost = 0.10  # Minimal management overhead
+                        
+                        zombie = Zombie(
+                            resource_type='CloudFront Distribution',
+                            resource_id=dist_id,
+                            region='global',
+                            estimated_monthly_cost=estimated_monthly_cost,
+                            reason='Distribution is disabled but still exists',
+                            extra={
+                                'domain_name': domain_name,
+                                'status': status,
+                                'enabled': enabled
+                            }
+                        )
+                        
+                        zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} unused CloudFront distributions", "WARNING")
@@ -677,12 +997,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for CloudFront distributions. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning CloudFront distributions: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning CloudFront distributions: {e}", "ERROR")
         
         return zombies
     
-    def scan_unused_lambda_functions(self, region: str) -> List[Dict[str, Any]]:
+    def scan_unused_lambda_functions(self, region: str) -> List[Zombie]:
         """
         Scan for Lambda functions with zero invocations in the past 90 days.
         
@@ -705,64 +1025,82 @@ class ZombieHunter:
         zombies = []
         
         try:
-            lambda_client = boto3.client('lambda', region_name=region)
-            cloudwatch = boto3.client('cloudwatch', region_name=region)
+            lambda_client = self._client('lambda', region)
+            cloudwatch = self._client('cloudwatch', region)
             
             self.log(f"Scanning Lambda functions in {region}...", "INFO")
             
-            # List all Lambda functions
-            paginator = lambda_client.get_paginator('list_functions')
+            # Use the same 90-day window for every function
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(days=90)
             
-            for page in paginator.paginate():
-                for function in page.get('Functions', []):
-                    function_name = function['FunctionName']
-                    memory_size = function.get('MemorySize', 128)
-                    code_size = function.get('CodeSize', 0)
-                    
-                    try:
-                        # Check invocations in last 90 days
-                        response = cloudwatch.get_metric_statistics(
-                            Namespace='AWS/Lambda',
-                            MetricName='Invocations',
-                            Dimensions=[{'Name': 'FunctionName', 'Value': function_name}],
-                            StartTime=datetime.now(timezone.utc) - timedelta(days=90),
-                            EndTime=datetime.now(timezone.utc),
-                            Period=86400 * 90,  # 90 days in seconds
-                            Statistics=['Sum']
-                        )
-                        
-                        total_invocations = sum([point['Sum'] for point in response.get('Datapoints', [])])
-                        
-                        # If no invocations in 90 days, it's a zombie
-                        if total_invocations == 0:
-                            # Estimate cost: storage + potential compute allocation
-                            # Storage: $0.0000166667 per GB-second
-                            # Assume function kept warm = ~$0.50-$2.00/month depending on memory
-                            if memory_size <= 512:
-                                estimated_monthly_cost = 0.50
-                            elif memory_size <= 1024:
-                                estimated_monthly_cost = 1.00
-                            else:
-                                estimated_monthly_cost = 2.00
-                            
-                            zombie = {
-                                'resource_type': 'Lambda Function',
-                                'resource_id': function_name,
-                                'region': region,
-                                'details': f"Memory: {memory_size}MB, Code Size: {code_size / 1024:.1f}KB, No invocations in 90 days",
-                                'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                                'reason': 'No invocations in the last 90 days'
-                            }
-                            
-                            zombies.append(zombie)
-                            self.findings.append(zombie)
-                    except Exception as e:
-                        # Skip if CloudWatch metrics not accessible
-                        if self.verbose:
-                            self.log(f"Could not check metrics for {function_name}: {e}", "WARNING")
-                        continue
+            def modified_before_window(function):
+                # LastModified looks like '2024-01-31T12:00:00.000+0000'
+                try:
+                    last_modified = datetime.strptime(function['LastModified'], '%Y-%m-%dT%H:%M:%S.%f%z')
+                except (KeyError, ValueError):
+                    return True
+                return last_modified < start_time
             
-            self.scan_summary['unused_lambda_functions'] += len(zombies)
+            # List all Lambda functions. Functions changed within the window
+            # don't have 90 days of history yet, so they are not checked.
+            paginator = lambda_client.get_paginator('list_functions')
+            functions = [
+                function
+                for page in paginator.paginate()
+                for function in page.get('Functions', [])
+                if modified_before_window(function)
+            ]
+            
+            # Fetch 90-day invocation totals for all functions in batched requests
+            queries = [
+                {
+                    'Id': f'invocations{index}',
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/Lambda',
+                            'MetricName': 'Invocations',
+                            'Dimensions': [{'Name': 'FunctionName', 'Value': function['FunctionName']}]
+                        },
+                        'Period': 86400 * 90,  # 90 days in seconds
+                        'Stat': 'Sum'
+                    }
+                }
+                for index, function in enumerate(functions)
+            ]
+            invocations = _batch_get_metric_data(cloudwatch, queries, start_time, end_time)
+            
+            for index, function in enumerate(functions):
+                function_name = function['FunctionName']
+                memory_size = function.get('MemorySize', 128)
+                code_size = function.get('CodeSize', 0)
+                
+                if f'invocations{index}' not in invocations:
+                    # Skip if CloudWatch metrics not accessible
+                    if self.verbose:
+                        self.log(f"Could not check metrics for {function_name}", "WARNING")
+                    continue
+                
+                total_invocations = sum(invocations[f'invocations{index}'])
+                
+                # If no invocations in 90 days, it's a zombie
+                if total_invocations == 0:
+                    # Estimate cost: storage + potential compute allocation
+                    # Assume function kept warm = ~$0.50-$2.00/month depending on memory
+                    estimated_monthly_cost = _lambda_monthly_cost(memory_size)
+                    
+                    zombie = Zombie(
+                        resource_type='Lambda Function',
+                        resource_id=function_name,
+                        region=region,
+                        estimated_monthly_cost=estimated_monthly_cost,
+                        reason='No invocations in the last 90 days',
+                        extra={
+                            'details': f"Memory: {memory_size}MB, Code Size: {code_size / 1024:.1f}KB, No invocations in 90 days"
+                        }
+                    )
+                    
+                    zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} unused Lambda functions", "WARNING")
@@ -775,12 +1113,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for Lambda functions. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning Lambda functions: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning Lambda functions: {e}", "ERROR")
         
         return zombies
     
-    def scan_idle_dynamodb_tables(self, region: str) -> List[Dict[str, Any]]:
+    def scan_idle_dynamodb_tables(self, region: str) -> List[Zombie]:
         """
         Scan for DynamoDB tables with zero read/write activity in the past 30 days.
         
@@ -803,81 +1141,97 @@ class ZombieHunter:
         zombies = []
         
         try:
-            dynamodb = boto3.client('dynamodb', region_name=region)
-            cloudwatch = boto3.client('cloudwatch', region_name=region)
+            dynamodb = self._client('dynamodb', region)
+            cloudwatch = self._client('cloudwatch', region)
             
             self.log(f"Scanning DynamoDB tables in {region}...", "INFO")
             
+            # Use the same 30-day window for every table
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(days=30)
+            
             # List all tables
             paginator = dynamodb.get_paginator('list_tables')
+            table_names = [
+                table_name
+                for page in paginator.paginate()
+                for table_name in page.get('TableNames', [])
+            ]
+            
+            # Fetch 30-day read/write totals for all tables in batched requests
+            queries = [
+                {
+                    'Id': f'{prefix}{index}',
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/DynamoDB',
+                            'MetricName': metric_name,
+                            'Dimensions': [{'Name': 'TableName', 'Value': table_name}]
+                        },
+                        'Period': 86400 * 30,  # 30 days
+                        'Stat': 'Sum'
+                    }
+                }
+                for index, table_name in enumerate(table_names)
+                for prefix, metric_name in (('reads', 'ConsumedReadCapacityUnits'),
+                                            ('writes', 'ConsumedWriteCapacityUnits'))
+            ]
+            activity = _batch_get_metric_data(cloudwatch, queries, start_time, end_time)
+            
+            idle_table_names = []
+            for index, table_name in enumerate(table_names):
+                if f'reads{index}' not in activity or f'writes{index}' not in activity:
+                    if self.verbose:
+                        self.log(f"Could not check table {table_name}", "WARNING")
+                    continue
+                
+                total_reads = sum(activity[f'reads{index}'])
+                total_writes = sum(activity[f'writes{index}'])
+                
+                # Only idle tables need their details
+                if total_reads == 0 and total_writes == 0:
+                    idle_table_names.append(table_name)
             
-            for page in paginator.paginate():
-                for table_name in page.get('TableNames', []):
-                    try:
-                        # Get table details
-                        table_info = dynamodb.describe_table(TableName=table_name)
-                        table = table_info['Table']
-                        
-                        billing_mode = table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED')
-                        table_size_bytes = table.get('TableSizeBytes', 0)
-                        item_count = table.get('ItemCount', 0)
-                        
-                        # Check read/write activity in last 30 days
-                        read_response = cloudwatch.get_metric_statistics(
-                            Namespace='AWS/DynamoDB',
-                            MetricName='ConsumedReadCapacityUnits',
-                            Dimensions=[{'Name': 'TableName', 'Value': table_name}],
-                            StartTime=datetime.now(timezone.utc) - timedelta(days=30),
-                            EndTime=datetime.now(timezone.utc),
-                            Period=86400 * 30,  # 30 days
-                            Statistics=['Sum']
-                        )
-                        
-                        write_response = cloudwatch.get_metric_statistics(
-                            Namespace='AWS/DynamoDB',
-                            MetricName='ConsumedWriteCapacityUnits',
-                            Dimensions=[{'Name': 'TableName', 'Value': table_name}],
-                            StartTime=datetime.now(timezone.utc) - timedelta(days=30),
-                            EndTime=datetime.now(timezone.utc),
-                            Period=86400 * 30,
-                            Statistics=['Sum']
-                        )
-                        
-                        total_reads = sum([point['Sum'] for point in read_response.get('Datapoints', [])])
-                        total_writes = sum([point['Sum'] for point in write_response.get('Datapoints', [])])
-                        
-                        # If no activity in 30 days, it's a zombie
-                        if total_reads == 0 and total_writes == 0:
-                            # Estimate cost based on billing mode
-                            if billing_mode == 'PROVISIONED':
-                                # Provisioned capacity: assume minimal 1 RCU + 1 WCU
-                                # $0.00013 per RCU-hour + $0.00065 per WCU-hour
-                                estimated_monthly_cost = (1 * 0.00013 + 1 * 0.00065) * 730  # hours/month
-                            else:
-                                # On-demand: storage cost only
-                                # $0.25 per GB-month
-                                estimated_monthly_cost = (table_size_bytes / (1024**3)) * 0.25
-                            
-                            # Minimum $0.25/month
-                            estimated_monthly_cost = max(0.25, estimated_monthly_cost)
-                            
-                            zombie = {
-                                'resource_type': 'DynamoDB Table',
-                                'resource_id': table_name,
-                                'region': region,
-                                'details': f"Billing: {billing_mode}, Size: {table_size_bytes / (1024**2):.1f}MB, Items: {item_count}, No activity in 30 days",
-                                'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                                'reason': 'No read/write activity in the last 30 days'
-                            }
-                            
-                            zombies.append(zombie)
-                            self.findings.append(zombie)
-                    except Exception as e:
-                        if self.verbose:
-                            self.log(f"Could not check table {table_name}: {e}", "WARNING")
-                        continue
-            
-            self.scan_summary['idle_dynamodb_tables'] += len(zombies)
+            def describe_table(table_name):
+                try:
+                    return dynamodb.describe_table(TableName=table_name)['Table']
+                except (ClientError, BotoCoreError) as e:
+                    if self.verbose:
+                        self.log(f"Could not check table {table_name}: {e}", "WARNING")
+                    return None
+            
+            # Describe idle tables concurrently; map() keeps results in table order
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, ITEM_LOOKUP_MAX_WORKERS)) as executor:
+                tables = list(executor.map(describe_table, idle_table_names))
+            
+            for table_name, table in zip(idle_table_names, tables):
+                if table is None:
+                    continue
+                
+                # Tables created within the window don't have 30 days of history yet
+                created = table.get('CreationDateTime')
+                if created and created > start_time:
+                    continue
+                
+                billing_mode = table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED')
+                table_size_bytes = table.get('TableSizeBytes', 0)
+                item_count = table.get('ItemCount', 0)
+                
+                # No activity in 30 days, it's a zombie
+                estimated_monthly_cost = _dynamodb_monthly_cost(billing_mode, table_size_bytes)
+                
+                zombie = Zombie(
+                    resource_type='DynamoDB Table',
+                    resource_id=table_name,
+                    region=region,
+                    estimated_monthly_cost=estimated_monthly_cost,
+                    reason='No read/write activity in the last 30 days',
+                    extra={
+                        'details': f"Billing: {billing_mode}, Size: {table_size_bytes / (1024**2):.1f}MB, Items: {item_count}, No activity in 30 days"
+                    }
+                )
+                
+                zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} idle DynamoDB tables", "WARNING")
@@ -890,12 +1244,12 @@ class ZombieHunter:
                 self.log(f"Permission denied for DynamoDB tables. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning DynamoDB tables: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning DynamoDB tables: {e}", "ERROR")
         
         return zombies
     
-    def scan_idle_elasticache_clusters(self, region: str) -> List[Dict[str, Any]]:
+    def scan_idle_elasticache_clusters(self, region: str) -> List[Zombie]:
         """
         Scan for ElastiCache clusters with zero connections in the past 14 days.
         
@@ -918,134 +1272,99 @@ class ZombieHunter:
         zombies = []
         
         try:
-            elasticache = boto3.client('elasticache', region_name=region)
-            cloudwatch = boto3.client('cloudwatch', region_name=region)
+            elasticache = self._client('elasticache', region)
+            cloudwatch = self._client('cloudwatch', region)
             
             self.log(f"Scanning ElastiCache clusters in {region}...", "INFO")
             
-            # Scan Redis clusters
+            # Use the same 14-day window for every cluster
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(days=14)
+            
+            # Collect available clusters as (engine, cluster ID, metric dimension, node type, node count)
+            clusters = []
+            
+            # Redis clusters
             redis_paginator = elasticache.get_paginator('describe_replication_groups')
             for page in redis_paginator.paginate():
                 for cluster in page.get('ReplicationGroups', []):
-                    cluster_id = cluster['ReplicationGroupId']
-                    status = cluster['Status']
-                    node_type = cluster.get('CacheNodeType', 'unknown')
-                    num_nodes = len(cluster.get('MemberClusters', []))
-                    
-                    if status != 'available':
+                    if cluster['Status'] != 'available':
                         continue
-                    
-                    try:
-                        # Check connections in last 14 days
-                        response = cloudwatch.get_metric_statistics(
-                            Namespace='AWS/ElastiCache',
-                            MetricName='CurrConnections',
-                            Dimensions=[{'Name': 'ReplicationGroupId', 'Value': cluster_id}],
-                            StartTime=datetime.now(timezone.utc) - timedelta(days=14),
-                            EndTime=datetime.now(timezone.utc),
-                            Period=86400 * 14,  # 14 days
-                            Statistics=['Maximum']
-                        )
-                        
-                        max_connections = max([point['Maximum'] for point in response.get('Datapoints', [])], default=0)
-                        
-                        # If no connections in 14 days, it's a zombie
-                        if max_connections == 0:
-                            # Estimate cost based on node type
-                            # Common node costs (per hour): cache.t3.micro=$0.017, cache.m5.large=$0.136, cache.r5.large=$0.188
-                            if 't2.micro' in node_type or 't3.micro' in node_type:
-                                hourly_cost = 0.017
-                            elif 't2.small' in node_type or 't3.small' in node_type:
-                                hourly_cost = 0.034
-                            elif 'm5.large' in node_type:
-                                hourly_cost = 0.136
-                            elif 'r5.large' in node_type:
-                                hourly_cost = 0.188
-                            else:
-                                hourly_cost = 0.10  # Conservative estimate
-                            
-                            estimated_monthly_cost = hourly_cost * 730 * num_nodes  # hours/month * nodes
-                            
-                            zombie = {
-                                'resource_type': 'ElastiCache Cluster (Redis)',
-                                'resource_id': cluster_id,
-                                'region': region,
-                                'details': f"Node Type: {node_type}, Nodes: {num_nodes}, No connections in 14 days",
-                                'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                                'reason': 'No connections in the last 14 days'
-                            }
-                            
-                            zombies.append(zombie)
-                            self.findings.append(zombie)
-                    except Exception as e:
-                        if self.verbose:
-                            self.log(f"Could not check metrics for {cluster_id}: {e}", "WARNING")
+                    # Clusters created within the window don't have 14 days of history yet
+                    created = cluster.get('ReplicationGroupCreateTime')
+                    if created and created > start_time:
                         continue
-            
-            # Scan Memcached clusters
+                    clusters.append((
+                        'Redis',
+                        cluster['ReplicationGroupId'],
+                        'ReplicationGroupId',
+                        cluster.get('CacheNodeType', 'unknown'),
+                        len(cluster.get('MemberClusters', []))
+                    ))
+            
+            # Memcached clusters
             memcached_paginator = elasticache.get_paginator('describe_cache_clusters')
             for page in memcached_paginator.paginate():
                 for cluster in page.get('CacheClusters', []):
-                    cluster_id = cluster['CacheClusterId']
-                    engine = cluster.get('Engine', '')
-                    
                     # Skip Redis clusters (already handled above)
-                    if engine != 'memcached':
+                    if cluster.get('Engine', '') != 'memcached':
                         continue
-                    
-                    status = cluster['CacheClusterStatus']
-                    node_type = cluster.get('CacheNodeType', 'unknown')
-                    num_nodes = cluster.get('NumCacheNodes', 1)
-                    
-                    if status != 'available':
+                    if cluster['CacheClusterStatus'] != 'available':
                         continue
-                    
-                    try:
-                        # Check connections in last 14 days
-                        response = cloudwatch.get_metric_statistics(
-                            Namespace='AWS/ElastiCache',
-                            MetricName='CurrConnections',
-                            Dimensions=[{'Name': 'CacheClusterId', 'Value': cluster_id}],
-                            StartTime=datetime.now(timezone.utc) - timedelta(days=14),
-                            EndTime=datetime.now(timezone.utc),
-                            Period=86400 * 14,
-                            Statistics=['Maximum']
-                        )
-                        
-                        max_connections = max([point['Maximum'] for point in response.get('Datapoints', [])], default=0)
-                        
-                        if max_connections == 0:
-                            # Same cost estimation as Redis
-                            if 't2.micro' in node_type or 't3.micro' in node_type:
-                                hourly_cost = 0.017
-                            elif 't2.small' in node_type or 't3.small' in node_type:
-                                hourly_cost = 0.034
-                            elif 'm5.large' in node_type:
-                                hourly_cost = 0.136
-                            elif 'r5.large' in node_type:
-                                hourly_cost = 0.188
-                            else:
-                                hourly_cost = 0.10
-                            
-                            estimated_monthly_cost = hourly_cost * 730 * num_nodes
-                            
-                            zombie = {
-                                'resource_type': 'ElastiCache Cluster (Memcached)',
-                                'resource_id': cluster_id,
-                                'region': region,
-                                'details': f"Node Type: {node_type}, Nodes: {num_nodes}, No connections in 14 days",
-                                'estimated_monthly_cost': f"${estimated_monthly_cost:.2f}",
-                                'reason': 'No connections in the last 14 days'
-                            }
-                            
-                            zombies.append(zombie)
-                            self.findings.append(zombie)
-                    except Exception as e:
-                        if self.verbose:
-                            self.log(f"Could not check metrics for {cluster_id}: {e}", "WARNING")
+                    created = cluster.get('CacheClusterCreateTime')
+                    if created and created > start_time:
                         continue
-            
-            self.scan_summary['idle_elasticache_clusters'] += len(zombies)
+                    clusters.append((
+                        'Memcached',
+                        cluster['CacheClusterId'],
+                        'CacheClusterId',
+                        cluster.get('CacheNodeType', 'unknown'),
+                        cluster.get('NumCacheNodes', 1)
+                    ))
+            
+            # Fetch 14-day peak connections for all clusters in batched requests
+            queries = [
+                {
+                    'Id': f'connections{index}',
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/ElastiCache',
+                            'MetricName': 'CurrConnections',
+                            'Dimensions': [{'Name': dimension, 'Value': cluster_id}]
+                        },
+                        'Period': 86400 * 14,  # 14 days
+                        'Stat': 'Maximum'
+                    }
+                }
+                for index, (_, cluster_id, dimension, _, _) in enumerate(clusters)
+            ]
+            connections = _batch_get_metric_data(cloudwatch, queries, start_time, end_time)
+            
+            for index, (engine, cluster_id, _, node_type, num_nodes) in enumerate(clusters):
+                if f'connections{index}' not in connections:
+                    if self.verbose:
+                        self.log(f"Could not check metrics for {cluster_id}", "WARNING")
+                    continue
+                
+                max_connections = max(connections[f'connections{index}'], default=0)
+                
+                # If no connections in 14 days, it's a zombie
+                if max_connections == 0:
+                    # Estimate cost based on node type
+                    estimated_monthly_cost = _elasticache_monthly_cost(node_type, num_nodes)
+                    
+                    zombie = Zombie(
+                        resource_type=f'ElastiCache Cluster ({engine})',
+                        resource_id=cluster_id,
+                        region=region,
+                        estimated_monthly_cost=estimated_monthly_cost,
+                        reason='No connections in the last 14 days',
+                        extra={
+                            'details': f"Node Type: {node_type}, Nodes: {num_nodes}, No connections in 14 days"
+                        }
+                    )
+                    
+                    zombies.append(zombie)
             
             if zombies:
                 self.log(f"Found {len(zombies)} idle ElastiCache clusters", "WARNING")
@@ -1058,62 +1377,80 @@ class ZombieHunter:
                 self.log(f"Permission denied for ElastiCache clusters. Skipping...", "WARNING")
             else:
                 self.log(f"Error scanning ElastiCache clusters: {e}", "ERROR")
-        except Exception as e:
+        except BotoCoreError as e:
             self.log(f"Unexpected error scanning ElastiCache clusters: {e}", "ERROR")
         
         return zombies
     
     def run_scan(self):
-        """Execute the complete scan across all specified regions."""
-        print(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
+        """
+        Execute the complete scan across all specified regions.
+        
+        Scans are I/O-bound, so every (scan, region) pair is dispatched to a
+        thread pool and runs concurrently. Results are collected in submission
+        order so the report does not depend on which scan finishes first.
+        """
+        print(f"\n{SEPARATOR}")
         print(f"{Fore.CYAN}CDOps Cloud Zombie Hunter{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Scanning for unused AWS resources...{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}\n")
-        
-        for region in self.regions:
-            print(f"\n{Fore.MAGENTA}>>> Scanning region: {region}{Style.RESET_ALL}\n")
-            
-            # Run all scans for this region
-            self.scan_unattached_ebs_volumes(region)
-            self.scan_obsolete_snapshots(region)
-            self.scan_idle_ec2_instances(region)
-            self.scan_unassociated_eips(region)
-            self.scan_unused_load_balancers(region)
-            self.scan_idle_rds_instances(region)
-            self.scan_empty_s3_buckets(region)
-            self.scan_unused_cloudfront_distributions(region)
-            self.scan_unused_lambda_functions(region)
-            self.scan_idle_dynamodb_tables(region)
-            self.scan_idle_elasticache_clusters(region)
+        print(f"{SEPARATOR}\n")
+        
+        print(f"\n{Fore.MAGENTA}>>> Scanning regions: {', '.join(self.regions)}{Style.RESET_ALL}\n")
+        
+        # Each scan paired with the scan_summary key it reports into
+        scans = [
+            ('unattached_ebs_volumes', self.scan_unattached_ebs_volumes),
+            ('obsolete_snapshots', self.scan_obsolete_snapshots),
+            ('idle_ec2_instances', self.scan_idle_ec2_instances),
+            ('unassociated_eips', self.scan_unassociated_eips),
+            ('unused_load_balancers', self.scan_unused_load_balancers),
+            ('idle_rds_instances', self.scan_idle_rds_instances),
+            ('empty_s3_buckets', self.scan_empty_s3_buckets),
+            ('unused_cloudfront_distributions', self.scan_unused_cloudfront_distributions),
+            ('unused_lambda_functions', self.scan_unused_lambda_functions),
+            ('idle_dynamodb_tables', self.scan_idle_dynamodb_tables),
+            ('idle_elasticache_clusters', self.scan_idle_elasticache_clusters)
+        ]
+        # S3 and CloudFront are global, so they only run with the first region
+        global_scans = {'empty_s3_buckets', 'unused_cloudfront_distributions'}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (key, region, executor.submit(scan, region))
+                for region in self.regions
+                for key, scan in scans
+                if key not in global_scans or region == self.regions[0]
+            ]
+        
+        for key, region, future in futures:
+            # Scans handle their own AWS errors; anything else (e.g. an
+            # unexpected response shape) is logged so the other scans still report
+            try:
+                zombies = future.result()
+            except Exception as e:
+                self.log(f"Unexpected error running {key} scan in {region}: {e}", "ERROR")
+                continue
+            self.findings.extend(zombies)
+            self.scan_summary[key] += len(zombies)
+            self._total_savings += sum(zombie.estimated_monthly_cost for zombie in zombies)
     
     def calculate_total_savings(self) -> float:
         """
         Calculate total estimated monthly savings from all zombie resources.
         
+        The total is accumulated by run_scan as findings are collected, so
+        print_summary and the exports do not each re-sum the findings.
+        
         Returns:
             Total estimated monthly cost savings in USD
         """
-        total_savings = 0.0
-        
-        for finding in self.findings:
-            if 'estimated_monthly_cost' in finding:
-                # Extract numeric value from cost string (e.g., "$12.50" -> 12.50)
-                cost_str = finding['estimated_monthly_cost']
-                try:
-                    # Remove $ and convert to float
-                    cost_value = float(cost_str.replace('$', '').replace(',', ''))
-                    total_savings += cost_value
-                except (ValueError, AttributeError):
-                    # Skip if cost can't be parsed
-                    pass
-        
-        return total_savings
+        return self._total_savings
     
     def print_summary(self):
         """Print a formatted summary of findings to the console."""
-        print(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
+        print(f"\n{SEPARATOR}")
         print(f"{Fore.CYAN}SCAN SUMMARY{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}\n")
+        print(f"{SEPARATOR}\n")
         
         # Prepare summary table
         summary_data = [
@@ -1132,7 +1469,7 @@ class ZombieHunter:
         
         print(tabulate(summary_data, headers=['Resource Type', 'Count'], tablefmt='grid'))
         
-        total_zombies = sum(self.scan_summary.values())
+        total_zombies = len(self.findings)
         total_savings = self.calculate_total_savings()
         
         if total_zombies > 0:
@@ -1155,35 +1492,39 @@ class ZombieHunter:
             return
         
         try:
-            # Get all unique keys from all findings
+            # Build the rows and collect all unique keys in a single pass
+            rows = []
             fieldnames = set()
             for finding in self.findings:
-                fieldnames.update(finding.keys())
+                row = finding.as_row()
+                fieldnames.update(row)
+                rows.append(row)
             
-            fieldnames = sorted(list(fieldnames))
+            fieldnames = sorted(fieldnames)
             
             # Calculate total savings
             total_savings = self.calculate_total_savings()
             total_zombies = len(self.findings)
             
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.findings)
+            # A 1 MiB buffer lets each write() syscall carry many rows
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as csvfile:
+                # Rows are written as lists in header order; missing columns are blank
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows([row.get(field, '') for field in fieldnames] for row in rows)
                 
                 # Add summary rows
-                writer.writerow({})  # Empty row for separation
+                writer.writerow([''] * len(fieldnames))  # Empty row for separation
                 
-                # Summary row
-                summary_row = {fieldnames[0]: '*** SUMMARY ***'}
-                if 'resource_id' in fieldnames:
-                    summary_row['resource_id'] = f'{total_zombies} total zombie resources'
-                if 'estimated_monthly_cost' in fieldnames:
-                    summary_row['estimated_monthly_cost'] = f'${total_savings:.2f}'
-                if 'reason' in fieldnames:
-                    summary_row['reason'] = f'Estimated Monthly Savings: ${total_savings:.2f} | Annual: ${total_savings * 12:.2f}'
+                # Summary row; Zombie.as_row() always provides these columns
+                summary_row = {
+                    fieldnames[0]: '*** SUMMARY ***',
+                    'resource_id': f'{total_zombies} total zombie resources',
+                    'estimated_monthly_cost': f'${total_savings:.2f}',
+                    'reason': f'Estimated Monthly Savings: ${total_savings:.2f} | Annual: ${total_savings * 12:.2f}'
+                }
                 
-                writer.writerow(summary_row)
+                writer.writerow([summary_row.get(field, '') for field in fieldnames])
             
             self.log(f"Report exported to: {filename}", "SUCCESS")
             print(f"{Fore.GREEN}📄 Full report saved: {filename}{Style.RESET_ALL}")
@@ -1192,31 +1533,148 @@ class ZombieHunter:
         except Exception as e:
             self.log(f"Error exporting to CSV: {e}", "ERROR")
     
+    def export_to_ndjson(self, filename: str):
+        """
+        Export findings as newline-delimited JSON, one finding per line.
+        
+        Values keep their native types (costs as numbers, timestamps in
+        ISO 8601), and no per-field quoting is done, so this is faster
+        than CSV for large reports and easier to load into other tools.
+        
+        Args:
+            filename: Output NDJSON filename
+        """
+        if not self.findings:
+            self.log("No findings to export.", "INFO")
+            return
+        
+        try:
+            total_savings = self.calculate_total_savings()
+            
+            with open(filename, 'w', encoding='utf-8', buffering=1024 * 1024) as ndjson_file:
+                encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str).encode
+                ndjson_file.writelines(f"{encode(finding.as_record())}\n" for finding in self.findings)
+            
+            self.log(f"Report exported to: {filename}", "SUCCESS")
+            print(f"{Fore.GREEN}📄 Full report saved: {filename}{Style.RESET_ALL}")
+            print(f"{Fore.CYAN}💰 Total estimated monthly savings: ${total_savings:.2f}{Style.RESET_ALL}")
+            
+        except Exception as e:
+            self.log(f"Error exporting to NDJSON: {e}", "ERROR")
+    
     def print_footer(self):
         """Print the marketing footer message."""
-        print(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
+        print(f"\n{SEPARATOR}")
         print(f"{Fore.GREEN}✅ Scan Complete!{Style.RESET_ALL}\n")
         print(f"{Fore.YELLOW}If you need help safely analyzing or cleaning up these resources,{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}contact the CDOps Tech SRE Team:{Style.RESET_ALL}\n")
         print(f"{Fore.CYAN}📧 Email: contact@cdops.tech{Style.RESET_ALL}")
         print(f"{Fore.CYAN}🌐 Web: https://cdops.tech{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}\n")
+        print(f"{SEPARATOR}\n")
+
+
+# The region list changes only a few times a year, so it is cached on disk.
+# Enabled opt-in regions differ between accounts, so there is one file per
+# AWS account ID (from sts:GetCallerIdentity).
+REGION_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'cdops-zombie-hunter'
+)
+REGION_CACHE_TTL = timedelta(days=7)
+
+# In-process copy of the region list, per account ID
+_regions = {}
+_regions_lock = threading.Lock()
+
+
+def _region_cache_file(account_id: str) -> str:
+    """
+    Get the region cache path for an AWS account.
+    
+    Args:
+        account_id: AWS account ID the region list belongs to
+        
+    Returns:
+        Path of the cache file
+    """
+    return os.path.join(REGION_CACHE_DIR, f"regions-{account_id}.json")
+
+
+def _load_cached_regions(cache_path: str) -> List[str]:
+    """
+    Read the region list from the on-disk cache.
+    
+    Args:
+        cache_path: Path of the cache file
+        
+    Returns:
+        List of region names, or an empty list if the cache is missing or stale
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            cache = json.load(cache_file)
+        fetched_at = datetime.fromisoformat(cache['fetched_at'])
+        if datetime.now(timezone.utc) - fetched_at < REGION_CACHE_TTL:
+            return list(cache['regions'])
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or corrupt cache - fall back to the API
+        pass
+    return []
+
+
+def _save_cached_regions(cache_path: str, regions: List[str]):
+    """
+    Write the region list to the on-disk cache. Failures are ignored.
+    
+    The file is written under a temporary name and then renamed, so a
+    concurrent run never reads a half-written cache.
+    
+    Args:
+        cache_path: Path of the cache file
+        regions: List of region names
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump({'fetched_at': datetime.now(timezone.utc).isoformat(), 'regions': regions}, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
-def get_all_regions() -> List[str]:
+def get_all_regions(account_id: str, refresh: bool = False) -> List[str]:
     """
     Retrieve all available AWS regions for EC2 service.
     
+    The result is reused for the rest of the process and cached on disk
+    per account for REGION_CACHE_TTL, saving a describe_regions call per run.
+    
+    Args:
+        account_id: AWS account ID of the current credentials
+        refresh: Ignore the on-disk cache and fetch the list from AWS
+        
     Returns:
         List of region names
     """
-    try:
-        ec2 = boto3.client('ec2')
-        response = ec2.describe_regions()
-        return [region['RegionName'] for region in response['Regions']]
-    except Exception as e:
-        print(f"{Fore.RED}Error retrieving regions: {e}{Style.RESET_ALL}")
-        return []
+    with _regions_lock:
+        if refresh or account_id not in _regions:
+            cache_path = _region_cache_file(account_id)
+            regions = [] if refresh else _load_cached_regions(cache_path)
+            if not regions:
+                try:
+                    ec2 = boto3.client('ec2', config=BOTO_CONFIG)
+                    response = ec2.describe_regions()
+                    regions = [region['RegionName'] for region in response['Regions']]
+                except Exception as e:
+                    print(f"{Fore.RED}Error retrieving regions: {e}{Style.RESET_ALL}")
+                    return []
+                _save_cached_regions(cache_path, regions)
+            _regions[account_id] = regions
+        return list(_regions[account_id])
 
 
 def main():
@@ -1235,11 +1693,20 @@ Examples:
   # Scan all regions
   python zombie_hunter.py --all-regions
   
+  # Scan all regions, refreshing the cached region list
+  python zombie_hunter.py --all-regions --refresh-regions
+  
   # Scan with verbose output
   python zombie_hunter.py --verbose
   
   # Custom output filename
   python zombie_hunter.py --output my_report.csv
+  
+  # Newline-delimited JSON report (faster for large accounts)
+  python zombie_hunter.py --format ndjson
+  
+  # Limit the number of concurrent scans
+  python zombie_hunter.py --all-regions --max-workers 8
         """
     )
     
@@ -1255,11 +1722,24 @@ Examples:
         help='Scan all AWS regions (this may take several minutes)'
     )
     
+    parser.add_argument(
+        '--refresh-regions',
+        action='store_true',
+        help='With --all-regions, ignore the cached region list and fetch it again'
+    )
+    
     parser.add_argument(
         '--output',
         type=str,
         default=None,
-        help='Output CSV filename (default: cdops_zombie_report_[timestamp].csv)'
+        help='Output filename (default: cdops_zombie_report_[timestamp].csv or .ndjson)'
+    )
+    
+    parser.add_argument(
+        '--format',
+        choices=['csv', 'ndjson'],
+        default='csv',
+        help='Report format (default: csv); ndjson is faster to write for large reports'
     )
     
     parser.add_argument(
@@ -1268,11 +1748,21 @@ Examples:
         help='Enable verbose output'
     )
     
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=16,
+        help='Maximum number of scans to run concurrently (default: 16)'
+    )
+    
     args = parser.parse_args()
     
+    if args.max_workers < 1:
+        parser.error('--max-workers must be at least 1')
+    
     # Validate AWS credentials
     try:
-        sts = boto3.client('sts')
+        sts = boto3.client('sts', config=BOTO_CONFIG)
         identity = sts.get_caller_identity()
         print(f"{Fore.GREEN}✅ AWS credentials validated{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Account ID: {identity['Account']}{Style.RESET_ALL}")
@@ -1299,7 +1789,7 @@ Examples:
     regions = []
     if args.all_regions:
         print(f"{Fore.YELLOW}Retrieving all AWS regions...{Style.RESET_ALL}")
-        regions = get_all_regions()
+        regions = get_all_regions(identity['Account'], args.refresh_regions)
         if not regions:
             print(f"{Fore.RED}Failed to retrieve regions. Exiting.{Style.RESET_ALL}")
             sys.exit(1)
@@ -1321,7 +1811,7 @@ Examples:
             sys.exit(1)
     
     # Initialize and run scanner
-    hunter = ZombieHunter(regions=regions, verbose=args.verbose)
+    hunter = ZombieHunter(regions=regions, verbose=args.verbose, max_workers=args.max_workers)
     hunter.run_scan()
     hunter.print_summary()
     
@@ -1330,9 +1820,12 @@ Examples:
         output_filename = args.output
     else:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_filename = f"cdops_zombie_report_{timestamp}.csv"
+        output_filename = f"cdops_zombie_report_{timestamp}.{args.format}"
     
-    hunter.export_to_csv(output_filename)
+    if args.format == 'ndjson':
+        hunter.export_to_ndjson(output_filename)
+    else:
+        hunter.export_to_csv(output_filename)
     
     # Print marketing footer
     hunter.print_footer()